@@ -0,0 +1,115 @@
+import base64
+import shutil
+import zipfile
+from pathlib import Path
+from .workloads import NEEDLE
+
+# Every case writes into this directory; it is wiped between cases
+SCRATCH = "_bench"
+
+# Upper bound for the payload passed to write_file / create_file
+MAX_PAYLOAD = 8 * 1024 * 1024
+
+# Size of each chunk sent to write_file_chunk
+CHUNK_SIZE = 1024 * 1024
+
+class Case:
+    """
+    A single benchmark scenario: one tool invoked with per-iteration arguments.
+    `prepare` runs once before the timed loop, `setup(i)` before every
+    iteration; neither is included in the measured latency.
+    """
+    def __init__(self, name, tool, args, setup=None, prepare=None, nbytes=None, mcp=True):
+        self.name = name
+        self.tool = tool
+        self.args = args
+        self.setup = setup
+        self.prepare = prepare
+        self.nbytes = nbytes
+        self.mcp = mcp
+
+def build_cases(root: Path, manifest: dict) -> list[Case]:
+    """Returns the cases covering every registered tool for a generated tree."""
+    text_file = manifest["text_file"]
+    binary_file = manifest["binary_file"]
+    base_dir = manifest["dir"]
+    text_size = (root / text_file).stat().st_size
+
+    with open(root / text_file, "rb") as fh:
+        payload = fh.read(MAX_PAYLOAD).decode("utf-8")
+    small_payload = payload[:4096]
+    chunk = payload.encode("utf-8")[:CHUNK_SIZE]
+    chunk_b64 = base64.b64encode(chunk).decode("ascii")
+    read_size = min(text_size, 2_000_000)
+
+    def scratch(name: str) -> str:
+        return f"{SCRATCH}/{name}"
+
+    def copy_text(name: str):
+        def setup(i):
+            dst = root / scratch(f"{name}_{i}.txt")
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(root / text_file, dst)
+        return setup
+
+    def make_dir(i):
+        (root / scratch(f"rd_{i}")).mkdir(parents=True, exist_ok=True)
+
+    def make_file(i):
+        p = root / scratch(f"rf_{i}.txt")
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(small_payload, encoding="utf-8")
+
+    def make_archive():
+        archive = root / scratch("source.zip")
+        archive.parent.mkdir(parents=True, exist_ok=True)
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zipf:
+            for f in (root / base_dir).rglob("*"):
+                if f.is_file():
+                    zipf.write(f, f.relative_to(root / base_dir))
+
+    cases = [
+        # --- Read tools ---
+        Case("list_dir", "list_dir", lambda i: {"path": base_dir}),
+        Case("get_dir_size", "get_dir_size", lambda i: {"path": "."}, nbytes=manifest["total_bytes"]),
+        Case("read_file_text", "read_file", lambda i: {"path": text_file}, nbytes=read_size),
+        Case("find_files", "find_files", lambda i: {"pattern": "*.txt"}),
+        Case("search_in_files", "search_in_files", lambda i: {"search_text": NEEDLE, "glob_pattern": "*.txt"}),
+        Case("get_file_stat", "get_file_stat", lambda i: {"path": text_file}),
+        Case("calculate_hash", "calculate_hash", lambda i: {"path": text_file}, nbytes=text_size),
+
+        # --- Write tools ---
+        Case("create_dir", "create_dir", lambda i: {"path": scratch(f"dir_{i}/a/b")}),
+        Case("rename_dir", "rename_dir", lambda i: {"src_path": scratch(f"rd_{i}"), "new_name": f"rd_{i}_renamed"}, setup=make_dir),
+        Case("write_file", "write_file", lambda i: {"path": scratch("write.txt"), "content": payload}, nbytes=len(payload)),
+        Case("write_file_append", "write_file", lambda i: {"path": scratch("append.txt"), "content": small_payload, "append": True}, nbytes=len(small_payload)),
+        # Iterations append consecutive chunks to one upload that is never finalized
+        Case("write_file_chunk", "write_file_chunk", lambda i: {"path": scratch("upload.bin"), "offset": i * len(chunk), "data_b64": chunk_b64}, nbytes=len(chunk)),
+        Case("create_file", "create_file", lambda i: {"path": scratch(f"new_{i}.txt"), "content": small_payload}, nbytes=len(small_payload)),
+        Case("rename_file", "rename_file", lambda i: {"src_path": scratch(f"rf_{i}.txt"), "new_name": f"rf_{i}_renamed.txt"}, setup=make_file),
+        Case("replace_in_file", "replace_in_file", lambda i: {"path": scratch(f"replace_{i}.txt"), "find_text": NEEDLE, "replace_with": "needle", "replace_all": True}, setup=copy_text("replace"), nbytes=text_size),
+        Case("insert_into_file", "insert_into_file", lambda i: {"path": scratch(f"insert_{i}.txt"), "content_to_insert": "inserted", "at_line": 10}, setup=copy_text("insert"), nbytes=text_size),
+        Case("touch_file", "touch_file", lambda i: {"path": text_file}),
+        Case("delete_path", "delete_path", lambda i: {"path": scratch(f"del_{i}.txt")}, setup=copy_text("del")),
+        Case("move_path", "move_path", lambda i: {"src": scratch(f"mv_{i}.txt"), "dst": scratch(f"moved_{i}.txt")}, setup=copy_text("mv")),
+        Case("copy_path_file", "copy_path", lambda i: {"src": text_file, "dst": scratch(f"copy_{i}.txt")}, setup=lambda i: (root / SCRATCH).mkdir(exist_ok=True), nbytes=text_size),
+        Case("copy_path_dir", "copy_path", lambda i: {"src": base_dir, "dst": scratch(f"tree_{i}")}),
+        Case("zip_files", "zip_files", lambda i: {"archive_path": scratch(f"archive_{i}.zip"), "files_to_add": [base_dir]}, setup=lambda i: (root / SCRATCH).mkdir(exist_ok=True)),
+        Case("unzip_file", "unzip_file", lambda i: {"archive_path": scratch("source.zip"), "extract_to_dir": scratch(f"unzip_{i}")}, prepare=make_archive),
+
+        # --- System tools ---
+        Case("run_command", "run_command", lambda i: {"cmd": "echo nyro", "cwd": "."}),
+
+        # --- Internals (direct mode only) ---
+        Case("safe_path", "safe_path", lambda i: {"p": text_file}, mcp=False),
+    ]
+
+    if binary_file:
+        binary_size = (root / binary_file).stat().st_size
+        cases.insert(3, Case("read_file_binary", "read_file", lambda i: {"path": binary_file}, nbytes=min(binary_size, 2_000_000)))
+
+    return cases
+
+def clear_scratch(root: Path):
+    """Removes everything the previous case left behind."""
+    shutil.rmtree(root / SCRATCH, ignore_errors=True)
@@ -0,0 +1,56 @@
+"""
+Compares two benchmark reports produced by `benchmarks.run`.
+
+Usage (from the repository root):
+    python -m benchmarks.compare base.json head.json --threshold 10
+
+Prints the median latency change for every case present in both reports and
+exits with status 1 if any case regressed by more than the threshold (percent).
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+def load(path: Path) -> tuple[dict, dict]:
+    report = json.loads(path.read_text(encoding="utf-8"))
+    cases = {}
+    for r in report.get("results", []):
+        if "error" not in r:
+            cases[(r["workload"], r["mode"], r["case"])] = r
+    return report.get("meta", {}), cases
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare two Nyro MCP benchmark reports.")
+    parser.add_argument("base", type=Path)
+    parser.add_argument("head", type=Path)
+    parser.add_argument("--threshold", type=float, default=10.0, help="Regression threshold in percent.")
+    args = parser.parse_args(argv)
+
+    base_meta, base = load(args.base)
+    head_meta, head = load(args.head)
+    print(f"base: {base_meta.get('commit') or args.base}")
+    print(f"head: {head_meta.get('commit') or args.head}")
+    print(f"{'workload':<14} {'mode':<7} {'case':<20} {'base ms':>10} {'head ms':>10} {'change':>9}")
+
+    regressions = 0
+    for key in sorted(base.keys() & head.keys()):
+        before = base[key]["latency_ms"]["median"]
+        after = head[key]["latency_ms"]["median"]
+        change = (after - before) / before * 100 if before else 0.0
+        flag = ""
+        if change > args.threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        print(f"{key[0]:<14} {key[1]:<7} {key[2]:<20} {before:>10.3f} {after:>10.3f} {change:>+8.1f}%{flag}")
+
+    for key in sorted(base.keys() ^ head.keys()):
+        side = "base" if key in base else "head"
+        print(f"{key[0]:<14} {key[1]:<7} {key[2]:<20} only in {side}")
+
+    if regressions:
+        print(f"{regressions} case(s) regressed by more than {args.threshold:.0f}%.")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+"""
+Benchmark harness for the Nyro MCP tool layer.
+
+Generates synthetic trees, runs every tool directly and through an in-process
+MCP client, and emits latency, throughput and peak RSS figures as JSON so that
+runs can be compared across commits (see `benchmarks.compare`).
+
+Usage (from the repository root):
+    python -m benchmarks.run --output bench.json
+    python -m benchmarks.run --workloads many_small --modes direct --iterations 20
+    python -m benchmarks.run --replay session.jsonl --replay-root ./fixture
+"""
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from importlib import metadata
+from pathlib import Path
+
+from src.nyro_mcp.server import mcp
+from src.nyro_mcp.config import settings
+from src.nyro_mcp import utils
+from src.nyro_mcp.tools import fs_read, fs_write, system
+from .cases import build_cases, clear_scratch
+from .workloads import WORKLOADS, generate
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+MODES = ("direct", "mcp")
+
+def tool_functions() -> dict:
+    """Maps tool names to the plain Python callables behind them."""
+    funcs = {"safe_path": utils.safe_path}
+    for module in (fs_read, fs_write, system):
+        for name in dir(module):
+            fn = getattr(module, name)
+            if callable(fn) and getattr(fn, "__module__", None) == module.__name__:
+                funcs[name] = fn
+    return funcs
+
+def log(msg: str):
+    print(msg, file=sys.stderr, flush=True)
+
+# --- Memory sampling ---
+
+def reset_peak_rss() -> bool:
+    """Resets the kernel's peak RSS counter (Linux only). Returns False if unsupported."""
+    try:
+        with open("/proc/self/clear_refs", "w") as fh:
+            fh.write("5")
+        return True
+    except OSError:
+        return False
+
+def peak_rss_kb() -> int | None:
+    """Peak resident set size in KiB since the last reset (or process start)."""
+    try:
+        with open("/proc/self/status") as fh:
+            for line in fh:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and KiB elsewhere
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+# --- Statistics ---
+
+def summarize(samples_ns: list[int], nbytes: int | None = None) -> dict:
+    ms = sorted(s / 1e6 for s in samples_ns)
+    mean = statistics.fmean(ms)
+    p95 = ms[min(len(ms) - 1, int(round(0.95 * (len(ms) - 1))))]
+    result = {
+        "latency_ms": {
+            "min": ms[0],
+            "median": statistics.median(ms),
+            "mean": mean,
+            "p95": p95,
+            "max": ms[-1],
+            "stdev": statistics.stdev(ms) if len(ms) > 1 else 0.0,
+        },
+        "ops_per_sec": 1000.0 / mean if mean else None,
+        "mb_per_sec": None,
+    }
+    if nbytes and mean:
+        result["mb_per_sec"] = (nbytes / (1024 * 1024)) / (mean / 1000.0)
+    return result
+
+# --- Execution backends ---
+
+class DirectRunner:
+    """Calls the tool functions in-process, bypassing MCP serialization."""
+    mode = "direct"
+
+    def __init__(self):
+        self.funcs = tool_functions()
+
+    async def call(self, tool: str, args: dict):
+        self.funcs[tool](**args)
+
+class McpRunner:
+    """Calls the tools through a ClientSession connected to the server over memory streams."""
+    mode = "mcp"
+
+    def __init__(self, session):
+        self.session = session
+
+    async def call(self, tool: str, args: dict):
+        result = await self.session.call_tool(tool, args)
+        if result.isError:
+            text = result.content[0].text if result.content else "unknown error"
+            raise utils.ToolError(text)
+
+async def run_case(runner, case, root: Path, iterations: int, warmup: int) -> dict:
+    record = {"case": case.name, "tool": case.tool, "iterations": iterations}
+    clear_scratch(root)
+    try:
+        if case.prepare:
+            case.prepare()
+        samples = []
+        rss_supported = reset_peak_rss()
+        for i in range(warmup + iterations):
+            if case.setup:
+                case.setup(i)
+            args = case.args(i)
+            start = time.perf_counter_ns()
+            await runner.call(case.tool, args)
+            elapsed = time.perf_counter_ns() - start
+            if i >= warmup:
+                samples.append(elapsed)
+        record.update(summarize(samples, case.nbytes))
+        record["bytes_per_op"] = case.nbytes
+        record["peak_rss_kb"] = peak_rss_kb()
+        # Without a resettable counter the value is a process-wide high-water mark
+        record["peak_rss_scope"] = "case" if rss_supported else "process"
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+    finally:
+        clear_scratch(root)
+    return record
+
+async def with_runner(mode: str, fn):
+    """Invokes `fn(runner)` with a runner for the requested mode."""
+    if mode == "direct":
+        return await fn(DirectRunner())
+    from mcp.shared.memory import create_connected_server_and_client_session
+    async with create_connected_server_and_client_session(mcp._mcp_server) as session:
+        return await fn(McpRunner(session))
+
+async def bench_workload(name: str, args, base_dir: Path) -> list[dict]:
+    root = Path(tempfile.mkdtemp(prefix=f"nyro_bench_{name}_", dir=base_dir)).resolve()
+    try:
+        log(f"[{name}] generating tree in {root}")
+        manifest = generate(name, root, seed=args.seed, scale=args.scale)
+        settings.ROOT = root
+        cases = [c for c in build_cases(root, manifest) if not args.cases or c.name in args.cases]
+        results = []
+        for mode in args.modes:
+            async def run_all(runner):
+                out = []
+                for case in cases:
+                    if mode == "mcp" and not case.mcp:
+                        continue
+                    record = await run_case(runner, case, root, args.iterations, args.warmup)
+                    record.update({"workload": name, "mode": mode})
+                    status = record.get("error") or f"median {record['latency_ms']['median']:.3f} ms"
+                    log(f"[{name}/{mode}] {case.name}: {status}")
+                    out.append(record)
+                return out
+            results.extend(await with_runner(mode, run_all))
+        return results
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+# --- Session replay ---
+
+def load_session(path: Path) -> list[tuple[str, dict]]:
+    """
+    Reads a recorded agent session. Each JSONL line is either
+    {"tool": name, "arguments": {...}} or a raw MCP request
+    {"method": "tools/call", "params": {"name": name, "arguments": {...}}}.
+    Other MCP messages (initialize, notifications, responses) are skipped.
+    """
+    calls = []
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            line = line.strip()
+            if not line:
+                continue
+            entry = json.loads(line)
+            if "tool" in entry:
+                calls.append((entry["tool"], entry.get("arguments") or {}))
+            elif entry.get("method") == "tools/call":
+                params = entry.get("params") or {}
+                calls.append((params["name"], params.get("arguments") or {}))
+    return calls
+
+async def replay_session(path: Path, args, base_dir: Path) -> list[dict]:
+    calls = load_session(path)
+    results = []
+    for mode in args.modes:
+        # Each mode replays against a pristine copy so mutating calls are repeatable
+        root = Path(tempfile.mkdtemp(prefix="nyro_replay_", dir=base_dir)).resolve()
+        try:
+            if args.replay_root:
+                shutil.copytree(args.replay_root, root, dirs_exist_ok=True)
+            settings.ROOT = root
+
+            async def run_all(runner):
+                by_tool: dict[str, list[int]] = {}
+                errors = 0
+                reset_peak_rss()
+                wall_start = time.perf_counter_ns()
+                for tool, tool_args in calls:
+                    start = time.perf_counter_ns()
+                    try:
+                        await runner.call(tool, tool_args)
+                    except Exception:
+                        # Recorded sessions contain failing calls; they are timed like any other
+                        errors += 1
+                    by_tool.setdefault(tool, []).append(time.perf_counter_ns() - start)
+                wall_ms = (time.perf_counter_ns() - wall_start) / 1e6
+                return {
+                    "session": str(path),
+                    "mode": mode,
+                    "calls": len(calls),
+                    "errors": errors,
+                    "wall_ms": wall_ms,
+                    "peak_rss_kb": peak_rss_kb(),
+                    "by_tool": {tool: dict(summarize(s), count=len(s)) for tool, s in by_tool.items()},
+                }
+            record = await with_runner(mode, run_all)
+            log(f"[replay/{mode}] {path.name}: {record['calls']} calls, {record['errors']} errors, {record['wall_ms']:.1f} ms")
+            results.append(record)
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+    return results
+
+# --- Reporting ---
+
+def git_commit() -> str | None:
+    try:
+        out = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+                             cwd=Path(__file__).resolve().parent)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def collect_meta(args) -> dict:
+    try:
+        mcp_version = metadata.version("mcp")
+    except metadata.PackageNotFoundError:
+        mcp_version = None
+    return {
+        "commit": git_commit(),
+        "timestamp": time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "mcp_version": mcp_version,
+        "iterations": args.iterations,
+        "warmup": args.warmup,
+        "scale": args.scale,
+        "seed": args.seed,
+    }
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Nyro MCP tool layer.")
+    parser.add_argument("--workloads", default=",".join(WORKLOADS),
+                        help=f"Comma separated workloads to run (default: all of {', '.join(WORKLOADS)}). Pass an empty string to skip.")
+    parser.add_argument("--modes", default=",".join(MODES), help="Comma separated execution modes: direct, mcp.")
+    parser.add_argument("--cases", default="", help="Comma separated case names to run (default: all).")
+    parser.add_argument("--iterations", type=int, default=5, help="Timed iterations per case.")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed iterations per case.")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplier for synthetic tree sizes.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for synthetic content.")
+    parser.add_argument("--replay", action="append", default=[], type=Path, help="Recorded session (JSONL) to replay. Repeatable.")
+    parser.add_argument("--replay-root", type=Path, help="Directory copied as ROOT before each replay.")
+    parser.add_argument("--tmp-dir", type=Path, help="Where synthetic trees are created (default: system temp).")
+    parser.add_argument("--output", default="-", help="Result file path, or '-' for stdout.")
+    args = parser.parse_args(argv)
+
+    args.workloads = [w for w in args.workloads.split(",") if w]
+    args.modes = [m for m in args.modes.split(",") if m]
+    args.cases = {c for c in args.cases.split(",") if c}
+    for w in args.workloads:
+        if w not in WORKLOADS:
+            parser.error(f"unknown workload: {w}")
+    for m in args.modes:
+        if m not in MODES:
+            parser.error(f"unknown mode: {m}")
+    if args.iterations < 1:
+        parser.error("--iterations must be at least 1")
+    return args
+
+async def run(args) -> dict:
+    base_dir = args.tmp_dir.resolve() if args.tmp_dir else None
+    results = []
+    for name in args.workloads:
+        results.extend(await bench_workload(name, args, base_dir))
+    replays = []
+    for path in args.replay:
+        replays.extend(await replay_session(path, args, base_dir))
+    return {"meta": collect_meta(args), "results": results, "replays": replays}
+
+def main(argv=None):
+    args = parse_args(argv)
+    # Tool logging would dominate the measurements and flood the terminal
+    logging.getLogger("nyro_mcp").disabled = True
+    logging.getLogger("mcp").setLevel(logging.WARNING)
+
+    report = asyncio.run(run(args))
+    text = json.dumps(report, indent=2)
+    if args.output == "-":
+        print(text)
+    else:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+        log(f"Results written to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import random
+from pathlib import Path
+
+# Size of the blocks used when streaming synthetic content to disk
+CHUNK_SIZE = 1 << 20
+
+WORDS = [
+    "alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel",
+    "india", "juliet", "kilo", "lima", "mike", "november", "oscar", "papa",
+]
+
+# Marker placed in every text file so content searches always have matches
+NEEDLE = "NYRO_NEEDLE"
+
+def _text_block(rng: random.Random, size: int) -> bytes:
+    """Builds roughly `size` bytes of newline separated pseudo-words."""
+    lines = []
+    total = 0
+    line_no = 0
+    while total < size:
+        line_no += 1
+        words = " ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 12)))
+        if line_no % 50 == 1:
+            words += f" {NEEDLE}"
+        line = f"{line_no:06d} {words}\n"
+        lines.append(line)
+        total += len(line)
+    return "".join(lines).encode("utf-8")[:size]
+
+def _write_text(path: Path, rng: random.Random, size: int):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as fh:
+        remaining = size
+        while remaining > 0:
+            block = _text_block(rng, min(CHUNK_SIZE, remaining))
+            fh.write(block)
+            remaining -= len(block)
+
+def _write_binary(path: Path, rng: random.Random, size: int):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as fh:
+        remaining = size
+        while remaining > 0:
+            n = min(CHUNK_SIZE, remaining)
+            # A leading 0xff byte guarantees the data never decodes as UTF-8
+            fh.write(b"\xff" + rng.randbytes(n - 1))
+            remaining -= n
+
+def many_small(root: Path, rng: random.Random, scale: float) -> dict:
+    """Thousands of 1-4 KB text files spread over a flat set of directories."""
+    count = max(20, int(2000 * scale))
+    for i in range(count):
+        _write_text(root / f"dir_{i % 20:02d}" / f"file_{i:05d}.txt", rng, rng.randint(1024, 4096))
+    return {
+        "text_file": "dir_00/file_00000.txt",
+        "binary_file": None,
+        "dir": "dir_00",
+        "file_count": count,
+    }
+
+def few_huge(root: Path, rng: random.Random, scale: float) -> dict:
+    """A handful of very large text and binary files."""
+    size = max(CHUNK_SIZE, int(32 * CHUNK_SIZE * scale))
+    _write_text(root / "huge" / "log_0.txt", rng, size)
+    _write_text(root / "huge" / "log_1.txt", rng, size)
+    _write_binary(root / "huge" / "blob_0.bin", rng, size)
+    return {
+        "text_file": "huge/log_0.txt",
+        "binary_file": "huge/blob_0.bin",
+        "dir": "huge",
+        "file_count": 3,
+    }
+
+def deep_nesting(root: Path, rng: random.Random, scale: float) -> dict:
+    """A narrow tree that is many directory levels deep."""
+    depth = max(8, int(64 * scale))
+    branches = 4
+    deepest = None
+    for b in range(branches):
+        parts = [f"b{b}"] + [f"level_{d:03d}" for d in range(depth)]
+        current = Path(*parts)
+        # Drop a small file on every fourth level so listings and globs have work to do
+        for d in range(0, depth, 4):
+            _write_text(root / Path(*parts[:d + 2]) / f"node_{d:03d}.txt", rng, 2048)
+        _write_text(root / current / "leaf.txt", rng, 4096)
+        if deepest is None:
+            deepest = current
+    return {
+        "text_file": str((deepest / "leaf.txt").as_posix()),
+        "binary_file": None,
+        "dir": str(deepest.as_posix()),
+        "file_count": branches * (depth // 4 + 1),
+    }
+
+def binary_mix(root: Path, rng: random.Random, scale: float) -> dict:
+    """An even mix of text and binary files of varying sizes."""
+    count = max(10, int(200 * scale))
+    for i in range(count):
+        size = rng.randint(4 * 1024, 256 * 1024)
+        if i % 2:
+            _write_binary(root / "mix" / f"asset_{i:04d}.bin", rng, size)
+        else:
+            _write_text(root / "mix" / f"doc_{i:04d}.txt", rng, size)
+    return {
+        "text_file": "mix/doc_0000.txt",
+        "binary_file": "mix/asset_0001.bin",
+        "dir": "mix",
+        "file_count": count,
+    }
+
+WORKLOADS = {
+    "many_small": many_small,
+    "few_huge": few_huge,
+    "deep_nesting": deep_nesting,
+    "binary_mix": binary_mix,
+}
+
+def generate(name: str, root: Path, seed: int = 0, scale: float = 1.0) -> dict:
+    """
+    Populates `root` with the named synthetic tree and returns its manifest.
+    The manifest names representative paths (relative to `root`) that the
+    benchmark cases operate on. Generation is deterministic for a given seed.
+    """
+    if name not in WORKLOADS:
+        raise ValueError(f"unknown workload: {name}")
+    rng = random.Random(f"{name}:{seed}")
+    manifest = WORKLOADS[name](root, rng, scale)
+    manifest["workload"] = name
+    manifest["total_bytes"] = sum(f.stat().st_size for f in root.rglob("*") if f.is_file())
+    return manifest
@@ -1,10 +1,19 @@
 import os
+import base64
+import hashlib
 import shutil
 import zipfile
+from pathlib import Path
 from ..server import mcp
 from ..utils import logger, safe_path, ToolError, RED, GREEN, BLUE, RESET
 from ..config import settings
 
+# Largest decoded chunk accepted by write_file_chunk, keeps per-call memory bounded
+MAX_CHUNK_SIZE = 8 * 1024 * 1024
+
+# In-progress uploads keyed by the path of their partial file
+_uploads = {}
+
 @mcp.tool()
 def create_dir(path: str):
     """Creates a directory, including all necessary parent directories."""
@@ -67,6 +76,151 @@ def write_file(path: str, content: str, append: bool = False):
         logger.error(f"{RED}Unexpected error writing to '{path}': {type(e).__name__} - {e}{RESET}")
         raise ToolError(f"internal_error: {e}")
 
+def _part_path(p: Path) -> Path:
+    """Location of the partial file an upload is written to before being renamed into place."""
+    return p.parent / f".{p.name}.nyro-part"
+
+def _pwrite_all(fd: int, data: bytes, offset: int):
+    """Writes all of `data` at `offset` without moving the file position (seek+write where pwrite is missing)."""
+    view = memoryview(data)
+    while view:
+        if hasattr(os, "pwrite"):
+            written = os.pwrite(fd, view, offset)
+        else:
+            os.lseek(fd, offset, os.SEEK_SET)
+            written = os.write(fd, view)
+        view = view[written:]
+        offset += written
+
+def _load_upload(part: Path):
+    """
+    Returns the session for a partial file, or None if there is none.
+    If the server restarted or the partial file changed underneath us,
+    the session is rebuilt by re-hashing the data already on disk.
+    """
+    if not part.is_file():
+        _uploads.pop(str(part), None)
+        return None
+
+    size = part.stat().st_size
+    session = _uploads.get(str(part))
+    if session and session["received"] == size:
+        return session
+
+    hasher = hashlib.sha256()
+    with open(part, "rb") as fh:
+        for block in iter(lambda: fh.read(65536), b""):
+            hasher.update(block)
+    session = {"received": size, "hasher": hasher}
+    _uploads[str(part)] = session
+    return session
+
+@mcp.tool()
+def write_file_chunk(path: str, offset: int, data_b64: str | None = None, text: str | None = None, final: bool = False, expected_sha256: str | None = None):
+    """Writes one chunk of a resumable upload (binary as base64 or UTF-8 text). The file is atomically replaced when `final` is set."""
+    logger.info(f"Receiving chunk for '{path}' at offset {offset} (final: {final})")
+    try:
+        if (data_b64 is None) == (text is None):
+            raise ToolError("invalid_args: Provide exactly one of data_b64 or text.")
+        if data_b64 is not None:
+            try:
+                data = base64.b64decode(data_b64, validate=True)
+            except ValueError:
+                raise ToolError("decode_error: data_b64 is not valid base64.")
+        else:
+            data = text.encode("utf-8")
+        if len(data) > MAX_CHUNK_SIZE:
+            raise ToolError(f"chunk_too_large: Chunks are limited to {MAX_CHUNK_SIZE} bytes.")
+
+        p = safe_path(path)
+        if p.is_dir():
+            raise ToolError("is_dir: Target path is a directory.")
+        part = _part_path(p)
+
+        if offset == 0:
+            # Offset 0 always starts a fresh upload, discarding any partial data
+            p.parent.mkdir(parents=True, exist_ok=True)
+            part.write_bytes(b"")
+            session = {"received": 0, "hasher": hashlib.sha256()}
+            _uploads[str(part)] = session
+        else:
+            session = _load_upload(part)
+            if session is None:
+                raise ToolError("no_upload: No upload in progress for this path. Start again at offset 0.")
+
+        if offset != session["received"]:
+            raise ToolError(f"offset_mismatch: Expected offset {session['received']}.")
+
+        fd = os.open(part, os.O_WRONLY | getattr(os, "O_BINARY", 0))
+        try:
+            _pwrite_all(fd, data, offset)
+            if final:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        session["hasher"].update(data)
+        session["received"] += len(data)
+        digest = session["hasher"].hexdigest()
+
+        if not final:
+            logger.info(f"{BLUE}SUCCESS: Chunk of {len(data)} bytes written to upload '{path}' ({session['received']} bytes received).{RESET}")
+            return {"status": "in_progress", "received": session["received"], "sha256": digest}
+
+        del _uploads[str(part)]
+        if expected_sha256 and expected_sha256.lower() != digest:
+            part.unlink()
+            raise ToolError(f"checksum_mismatch: Upload discarded, received data has sha256 {digest}.")
+
+        os.replace(part, p)
+        logger.info(f"{GREEN}SUCCESS: Upload to '{path}' completed ({session['received']} bytes).{RESET}")
+        return {"status": "completed", "path": str(p.relative_to(settings.ROOT)), "size": session["received"], "sha256": digest}
+    except ToolError as e:
+        logger.error(f"{RED}Error writing chunk to '{path}': {e}{RESET}")
+        raise
+    except Exception as e:
+        logger.error(f"{RED}Unexpected error writing chunk to '{path}': {type(e).__name__} - {e}{RESET}")
+        raise ToolError(f"internal_error: {e}")
+
+@mcp.tool()
+def get_upload_status(path: str):
+    """Reports how many bytes of an interrupted upload were received, so it can be resumed."""
+    logger.info(f"Checking upload status for: {path}")
+    try:
+        p = safe_path(path)
+        session = _load_upload(_part_path(p))
+        if session is None:
+            logger.info(f"{BLUE}SUCCESS: No upload in progress for '{path}'.{RESET}")
+            return {"status": "none", "received": 0}
+
+        logger.info(f"{BLUE}SUCCESS: Upload '{path}' has {session['received']} bytes received.{RESET}")
+        return {"status": "in_progress", "received": session["received"], "sha256": session["hasher"].hexdigest()}
+    except ToolError as e:
+        logger.error(f"{RED}Error checking upload '{path}': {e}{RESET}")
+        raise
+    except Exception as e:
+        logger.error(f"{RED}Unexpected error checking upload: {type(e).__name__} - {e}{RESET}")
+        raise ToolError(f"internal_error: {e}")
+
+@mcp.tool()
+def abort_upload(path: str):
+    """Cancels an upload in progress and removes its partial data. The target file is left untouched."""
+    logger.info(f"Aborting upload for: {path}")
+    try:
+        part = _part_path(safe_path(path))
+        _uploads.pop(str(part), None)
+        if not part.is_file():
+            raise ToolError("no_upload: No upload in progress for this path.")
+
+        part.unlink()
+        logger.info(f"{GREEN}SUCCESS: Upload to '{path}' aborted.{RESET}")
+        return {"status": "aborted"}
+    except ToolError as e:
+        logger.error(f"{RED}Error aborting upload '{path}': {e}{RESET}")
+        raise
+    except Exception as e:
+        logger.error(f"{RED}Unexpected error aborting upload: {type(e).__name__} - {e}{RESET}")
+        raise ToolError(f"internal_error: {e}")
+
 @mcp.tool()
 def create_file(path: str, content: str = ""):
     """Creates a new file with optional initial content. Fails if file already exists."""